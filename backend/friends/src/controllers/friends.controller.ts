@@ -5,6 +5,7 @@ import { IReplyPic } from '../shared/types/profile.type.js';
 import { ErrorResponse } from '../shared/types/error.type.js';
 import { ErrorCodes } from '../shared/constants/error.const.js';
 import { sendError, isValidId } from '../helper/friends.helper.js';
+import { LOOKUP_CONCURRENCY, mapWithConcurrency } from '../shared/helpers/concurrency.helper.js';
 import { IReplyGetFriend, IReplyFriendStatus } from '../shared/types/friends.types.js';
 import { friendsRequestCreationCounter, recordMediumDatabaseMetrics } from '../telemetry/metrics.js';
 
@@ -18,6 +19,44 @@ declare module 'fastify' {
   }
 }
 
+/**
+ * Fills in a friend's username from the auth service, falling back to 'undefined'.
+ *
+ * @param request - FastifyRequest object used for logging.
+ * @param friend - The friend entry to update in place.
+ */
+async function fillUsername(request: FastifyRequest, friend: IReplyGetFriend): Promise<void> {
+  try {
+    const serviceUrl = `http://${process.env.AUTH_ADDR || 'localhost'}:${process.env.AUTH_PORT || 8082}/username/${friend.id}`;
+    const response = await fetch(serviceUrl, { method: 'GET' });
+    const user = (await response.json()) as IUsername | ErrorResponse;
+    if ('username' in user) friend.username = user.username;
+    else friend.username = 'undefined';
+  } catch (err) {
+    request.server.log.error(err);
+    friend.username = 'undefined';
+  }
+}
+
+/**
+ * Fills in a friend's profile picture link from the profile service, falling back to 'default'.
+ *
+ * @param request - FastifyRequest object used for logging.
+ * @param friend - The friend entry to update in place.
+ */
+async function fillPic(request: FastifyRequest, friend: IReplyGetFriend): Promise<void> {
+  try {
+    const serviceUrl = `http://${process.env.PROFILE_ADDR || 'localhost'}:${process.env.PROFILE_PORT || 8082}/pics/${friend.id}`;
+    const response = await fetch(serviceUrl, { method: 'GET' });
+    const pic = (await response.json()) as IReplyPic | ErrorResponse;
+    if ('link' in pic) friend.pic = pic.link;
+    else friend.pic = 'default';
+  } catch (err) {
+    request.server.log.error(err);
+    friend.pic = 'default';
+  }
+}
+
 /**
  * Retrieves the list of friends for a given user.
  *
@@ -49,29 +88,14 @@ export async function getFriends(
     );
 		recordMediumDatabaseMetrics('SELECT', 'friends', performance.now() - startTime);
     if (!friends) return sendError(reply, 404, ErrorCodes.FRIENDS_NOTFOUND);
-    for (let i = 0; i < friends.length; i++) {
-      friends[i].request = friends[i].requesting !== id && friends[i].accepted === false;
-      try {
-        const serviceUrl = `http://${process.env.AUTH_ADDR || 'localhost'}:${process.env.AUTH_PORT || 8082}/username/${friends[i].id}`;
-        const response = await fetch(serviceUrl, { method: 'GET' });
-        const user = (await response.json()) as IUsername | ErrorResponse;
-        if ('username' in user) friends[i].username = user.username;
-        else friends[i].username = 'undefined';
-      } catch (err) {
-        request.server.log.error(err);
-        friends[i].username = 'undefined';
-      }
-      try {
-        const serviceUrl = `http://${process.env.PROFILE_ADDR || 'localhost'}:${process.env.PROFILE_PORT || 8082}/pics/${friends[i].id}`;
-        const response = await fetch(serviceUrl, { method: 'GET' });
-        const pic = (await response.json()) as IReplyPic | ErrorResponse;
-        if ('link' in pic) friends[i].pic = pic.link;
-        else friends[i].pic = 'default';
-      } catch (err) {
-        request.server.log.error(err);
-        friends[i].pic = 'default';
-      }
+    for (const friend of friends) {
+      friend.request = friend.requesting !== id && friend.accepted === false;
     }
+    await mapWithConcurrency(
+      friends.flatMap((friend) => [() => fillUsername(request, friend), () => fillPic(request, friend)]),
+      LOOKUP_CONCURRENCY,
+      (lookup) => lookup()
+    );
     return reply.code(200).send(friends);
   } catch (err) {
     request.server.log.error(err);
@@ -110,29 +134,14 @@ export async function getFriendsMe(
     );
 		recordMediumDatabaseMetrics('SELECT', 'friends', performance.now() - startTime);
     if (!friends) return sendError(reply, 404, ErrorCodes.FRIENDS_NOTFOUND);
-    for (let i = 0; i < friends.length; i++) {
-      friends[i].request = friends[i].requesting !== id && friends[i].accepted === false;
-      try {
-        const serviceUrl = `http://${process.env.AUTH_ADDR || 'localhost'}:${process.env.AUTH_PORT || 8082}/username/${friends[i].id}`;
-        const response = await fetch(serviceUrl, { method: 'GET' });
-        const user = (await response.json()) as IUsername | ErrorResponse;
-        if ('username' in user) friends[i].username = user.username;
-        else friends[i].username = 'undefined';
-      } catch (err) {
-        request.server.log.error(err);
-        friends[i].username = 'undefined';
-      }
-      try {
-        const serviceUrl = `http://${process.env.PROFILE_ADDR || 'localhost'}:${process.env.PROFILE_PORT || 8082}/pics/${friends[i].id}`;
-        const response = await fetch(serviceUrl, { method: 'GET' });
-        const pic = (await response.json()) as IReplyPic | ErrorResponse;
-        if ('link' in pic) friends[i].pic = pic.link;
-        else friends[i].pic = 'default';
-      } catch (err) {
-        request.server.log.error(err);
-        friends[i].pic = 'default';
-      }
+    for (const friend of friends) {
+      friend.request = friend.requesting !== id && friend.accepted === false;
     }
+    await mapWithConcurrency(
+      friends.flatMap((friend) => [() => fillUsername(request, friend), () => fillPic(request, friend)]),
+      LOOKUP_CONCURRENCY,
+      (lookup) => lookup()
+    );
     return reply.code(200).send(friends);
   } catch (err) {
     request.server.log.error(err);
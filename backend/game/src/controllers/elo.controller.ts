@@ -9,6 +9,7 @@ import { ErrorResponse } from '../shared/types/error.type.js';
 import { IId, GetPageQuery } from '../shared/types/match.type.js';
 import { Elo, DailyElo, LeaderboardEntry } from '../shared/types/elo.type.js';
 import { ErrorCodes, createErrorResponse } from '../shared/constants/error.const.js';
+import { LOOKUP_CONCURRENCY, mapWithConcurrency } from '../shared/helpers/concurrency.helper.js';
 
 /**
  * Calculates the new Elo ratings for a winner and a loser of a match.
@@ -16,18 +17,18 @@ import { ErrorCodes, createErrorResponse } from '../shared/constants/error.const
  *
  * @param winnerElo - The current Elo rating of the match winner.
  * @param loserElo - The current Elo rating of the match loser.
- * @returns A Promise that resolves to an object containing the new Elo ratings
- *          for the winner and the loser, e.g., { winnerElo: number, loserElo: number }.
+ * @returns An object containing the new Elo ratings for the winner and the loser,
+ *          e.g., { winnerElo: number, loserElo: number }.
  *          The ratings are rounded to the nearest integer.
  */
-async function calculateEloChange(
+function calculateEloChange(
   winnerElo: number,
   loserElo: number
-): Promise<{ winnerElo: number; loserElo: number }> {
+): { winnerElo: number; loserElo: number } {
   const K_FACTOR = 32;
 
   const expectedWinner = 1 / (1 + Math.pow(10, (loserElo - winnerElo) / 400));
-  const expectedLoser = 1 / (1 + Math.pow(10, (winnerElo - loserElo) / 400));
+  const expectedLoser = 1 - expectedWinner;
   const newWinnerElo = Math.round(winnerElo + K_FACTOR * (1 - expectedWinner));
   const newLoserElo = Math.round(loserElo + K_FACTOR * (0 - expectedLoser));
 
@@ -168,7 +169,7 @@ export async function updateEloRatings(
     const missingPlayer = !winnerElo ? winner : loser;
     throw new Error(ErrorCodes.ELO_NOT_FOUND + `:${missingPlayer}`);
   }
-  const { winnerElo: newWinnerElo, loserElo: newLoserElo } = await calculateEloChange(
+  const { winnerElo: newWinnerElo, loserElo: newLoserElo } = calculateEloChange(
     winnerElo.elo,
     loserElo.elo
   );
@@ -219,23 +220,27 @@ export async function getLeaderboard(
       offset
     )) as LeaderboardEntry[];
 		recordMediumDatabaseMetrics('SELECT', 'leaderboard', performance.now() - startTime);
-    for (let i = 0; i < leaderboard.length; i++) {
-      try {
-        const serviceUrl = `http://${process.env.AUTH_ADDR || 'localhost'}:${process.env.AUTH_PORT || 8082}/user/${leaderboard[i].player}`;
-        const response = await fetch(serviceUrl, { method: 'GET' });
-        const user = (await response.json()) as IReplyUser | ErrorResponse;
-        if ('username' in user && user.username !== 'ai') {
-          leaderboard[i].username = user.username;
-        } else {
-          leaderboard.splice(i, 1);
-          i--;
+    const entries = await mapWithConcurrency(
+      leaderboard,
+      LOOKUP_CONCURRENCY,
+      async (entry): Promise<LeaderboardEntry | null> => {
+        try {
+          const serviceUrl = `http://${process.env.AUTH_ADDR || 'localhost'}:${process.env.AUTH_PORT || 8082}/user/${entry.player}`;
+          const response = await fetch(serviceUrl, { method: 'GET' });
+          const user = (await response.json()) as IReplyUser | ErrorResponse;
+          if ('username' in user && user.username !== 'ai') {
+            entry.username = user.username;
+            return entry;
+          }
+          return null;
+        } catch (err) {
+          request.server.log.error(err);
+          entry.username = 'undefined';
+          return entry;
         }
-      } catch (err) {
-				request.server.log.error(err);
-        leaderboard[i].username = 'undefined';
       }
-    }
-    return reply.code(200).send(leaderboard);
+    );
+    return reply.code(200).send(entries.filter((entry) => entry !== null));
   } catch (err) {
 		request.server.log.error(err);
     const errorResponse = createErrorResponse(500, ErrorCodes.INTERNAL_ERROR);
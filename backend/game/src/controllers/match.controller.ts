@@ -15,6 +15,7 @@ import { FastifyRequest, FastifyReply } from 'fastify';
 import { IUsername } from '../shared/types/auth.types.js';
 import { IId, IMatchId, MatchHistory } from '../shared/types/match.type.js';
 import { ErrorCodes, createErrorResponse } from '../shared/constants/error.const.js';
+import { LOOKUP_CONCURRENCY, mapWithConcurrency } from '../shared/helpers/concurrency.helper.js';
 
 /**
  * Retrieves a single match by its ID.
@@ -93,46 +94,32 @@ export async function getMatchHistory(
       const errorResponse = createErrorResponse(404, ErrorCodes.MATCH_NOT_FOUND);
       return reply.code(404).send(errorResponse);
     }
-    const matchesHistory: MatchHistory[] = [];
-    for (let i = 0; i < matches.length; i++) {
-      const serviceUrlUsername1 = `http://${process.env.AUTH_ADDR || 'localhost'}:${process.env.AUTH_PORT || 8082}/username/${id}`;
-      const responseUsername1 = await fetch(serviceUrlUsername1, { method: 'GET' });
-      const responseDataUsername1 = (await responseUsername1.json()) as IUsername;
-      let responseDataUsername2: IUsername;
-			let matchHistory: MatchHistory;
-      if (id === matches[i].player_1) {
-        const serviceUrlUsername2 = `http://${process.env.AUTH_ADDR || 'localhost'}:${process.env.AUTH_PORT || 8082}/username/${matches[i].player_2}`;
-        const responseUsername2 = await fetch(serviceUrlUsername2, { method: 'GET' });
-        responseDataUsername2 = (await responseUsername2.json()) as IUsername;
-        matchHistory = {
-          matchId: matches[i].match_id || 'undefined',
-          username1: responseDataUsername1.username || 'undefined',
-          id1: request.params.id,
-          goals1: matches[i].p1_score,
-          username2: responseDataUsername2.username || 'undefined',
-          id2: matches[i].player_2,
-          goals2: matches[i].p2_score,
-					final: matches[i].final,
-          created_at: matches[i].created_at || 'undefined',
-        };
-      } else {
-        const serviceUrlUsername2 = `http://${process.env.AUTH_ADDR || 'localhost'}:${process.env.AUTH_PORT || 8082}/username/${matches[i].player_1}`;
-        const responseUsername2 = await fetch(serviceUrlUsername2, { method: 'GET' });
-         responseDataUsername2 = (await responseUsername2.json()) as IUsername;
-				 matchHistory = {
-          matchId: matches[i].match_id || 'undefined',
-          username1: responseDataUsername1.username || 'undefined',
-          id1: request.params.id,
-          goals1: matches[i].p2_score,
-          username2: responseDataUsername2.username || 'undefined',
-          id2: matches[i].player_1,
-          goals2: matches[i].p1_score,
-					final: matches[i].final,
-          created_at: matches[i].created_at || 'undefined',
-        };
-      }
-      matchesHistory.push(matchHistory);
-    }
+    if (matches.length === 0) return reply.code(200).send([]);
+    const fetchUsername = async (playerId: string): Promise<IUsername> => {
+      const serviceUrl = `http://${process.env.AUTH_ADDR || 'localhost'}:${process.env.AUTH_PORT || 8082}/username/${playerId}`;
+      const response = await fetch(serviceUrl, { method: 'GET' });
+      return (await response.json()) as IUsername;
+    };
+    const playerIds = [id, ...matches.map((match) => (id === match.player_1 ? match.player_2 : match.player_1))];
+    const [responseDataUsername1, ...opponentUsernames] = await mapWithConcurrency(
+      playerIds,
+      LOOKUP_CONCURRENCY,
+      fetchUsername
+    );
+    const matchesHistory: MatchHistory[] = matches.map((match, i) => {
+      const isPlayer1 = id === match.player_1;
+      return {
+        matchId: match.match_id || 'undefined',
+        username1: responseDataUsername1.username || 'undefined',
+        id1: request.params.id,
+        goals1: isPlayer1 ? match.p1_score : match.p2_score,
+        username2: opponentUsernames[i].username || 'undefined',
+        id2: isPlayer1 ? match.player_2 : match.player_1,
+        goals2: isPlayer1 ? match.p2_score : match.p1_score,
+        final: match.final,
+        created_at: match.created_at || 'undefined',
+      };
+    });
     return reply.code(200).send(matchesHistory);
   } catch (err) {
 		request.server.log.error(err);
@@ -1,6 +1,7 @@
 import { IId, IUsername } from '../shared/types/auth.types.js';
 import { ErrorCodes, createErrorResponse } from '../shared/constants/error.const.js';
 import { sendError, isValidId } from '../helper/friends.helper.js';
+import { LOOKUP_CONCURRENCY, mapWithConcurrency } from '../shared/helpers/concurrency.helper.js';
 import { recordMediumDatabaseMetrics } from '../telemetry/metrics.js';
 import { FastifyRequest, FastifyReply, FastifyInstance } from 'fastify';
 import { Finalist, FinalResultObject, TournamentMatch, GetPageQuery } from '../shared/types/match.type.js';
@@ -46,30 +47,28 @@ export async function getTournament(
       const errorResponse = createErrorResponse(404, ErrorCodes.MATCH_NOT_FOUND);
       return reply.code(404).send(errorResponse);
     }
-    let matchesHistory: TournamentMatch[] = [];
-    for (let i = 0; i < matches.length; i++) {
-      const serviceUrlUsername1 = `http://${process.env.AUTH_ADDR || 'localhost'}:${process.env.AUTH_PORT || 8082}/username/${matches[i].player_1}`;
-      const responseUsername1 = await fetch(serviceUrlUsername1, { method: 'GET' });
-      const responseDataUsername1 = (await responseUsername1.json()) as IUsername;
-      let responseDataUsername2: IUsername;
-			let matchHistory: TournamentMatch;
-			const serviceUrlUsername2 = `http://${process.env.AUTH_ADDR || 'localhost'}:${process.env.AUTH_PORT || 8082}/username/${matches[i].player_2}`;
-			const responseUsername2 = await fetch(serviceUrlUsername2, { method: 'GET' });
-			responseDataUsername2 = (await responseUsername2.json()) as IUsername;
-			matchHistory = {
-				matchId: matches[i].match_id || 'undefined',
-				username1: responseDataUsername1.username || 'undefined',
-				id1: matches[i].player_1,
-				goals1: matches[i].p1_score,
-				username2: responseDataUsername2.username || 'undefined',
-				id2: matches[i].player_2,
-				goals2: matches[i].p2_score,
-				winner: matches[i].p1_score > matches[i].p2_score ? matches[i].player_1 : matches[i].player_2,
-				final: matches[i].final,
-				created_at: matches[i].created_at || 'undefined',
-			};
-      matchesHistory.push(matchHistory);
-    }
+    const fetchUsername = async (playerId: string): Promise<IUsername> => {
+      const serviceUrl = `http://${process.env.AUTH_ADDR || 'localhost'}:${process.env.AUTH_PORT || 8082}/username/${playerId}`;
+      const response = await fetch(serviceUrl, { method: 'GET' });
+      return (await response.json()) as IUsername;
+    };
+    const usernames = await mapWithConcurrency(
+      matches.flatMap((match) => [match.player_1, match.player_2]),
+      LOOKUP_CONCURRENCY,
+      fetchUsername
+    );
+    const matchesHistory: TournamentMatch[] = matches.map((match, i) => ({
+      matchId: match.match_id || 'undefined',
+      username1: usernames[2 * i].username || 'undefined',
+      id1: match.player_1,
+      goals1: match.p1_score,
+      username2: usernames[2 * i + 1].username || 'undefined',
+      id2: match.player_2,
+      goals2: match.p2_score,
+      winner: match.p1_score > match.p2_score ? match.player_1 : match.player_2,
+      final: match.final,
+      created_at: match.created_at || 'undefined',
+    }));
     return reply.code(200).send(matchesHistory);
   } catch (err) {
 		request.server.log.error(err);
@@ -47,7 +47,6 @@ export async function checkMicroservicesHook(request: FastifyRequest, reply: Fas
 /**
  * Checks the health of all microservices (profile, auth, game, friends) and updates their status in Server.microservices.
  *
- * @param fastify - FastifyInstance for logging.
  * @returns Promise<void>
  */
 export async function checkMicroservices() {
@@ -64,7 +63,7 @@ export async function checkMicroservices() {
     Server.microservices.set(process.env.GAME_ADDR || 'game', gameStatus);
     Server.microservices.set(process.env.FRIENDS_ADDR || 'friends', friendsStatus);
   } catch (err) {
-    console.error('Error checking microservices:', err);
+    Server.getInstance().log.error(err, 'Error checking microservices');
   }
 }
 
@@ -81,7 +80,7 @@ async function checkService(serviceName: string, servicePort: string): Promise<b
     const response = await fetch(serviceUrl, { method: 'GET' });
     return response.ok;
   } catch (err) {
-		console.error('Error checking microservices:', err);
+    Server.getInstance().log.error(err, `Error checking service ${serviceName}`);
     return false;
   }
 }
@@ -3,11 +3,38 @@ import { IId } from '../shared/types/gateway.types.js';
 import { FastifyInstance, FastifyRequest } from 'fastify';
 
 const connectedClients = new Map<string, WebSocket>();
+const PONG_FRAME = JSON.stringify({ type: 'pong' }); // Pre-encoded reply to client pings
 
 // Rate limiting constants
-const MAX_MESSAGES_PER_WINDOW = 10; // Max 10 messages
+// Token bucket: sustained 10 messages per 5 seconds, with bursts of up to 10.
+// A full bucket plus its refill lets at most 20 messages through in any single 5 s window.
+const MAX_MESSAGES_PER_WINDOW = 10; // Sustained rate and bucket capacity
 const RATE_LIMIT_WINDOW_MS = 5000; // Per 5 seconds
-const userMessageTimestamps = new Map<string, number[]>(); // Stores timestamps of messages for each user
+const REFILL_PER_MS = MAX_MESSAGES_PER_WINDOW / RATE_LIMIT_WINDOW_MS;
+const userMessageBuckets = new Map<string, { tokens: number; lastRefill: number }>(); // Token bucket for each user
+
+/**
+ * Takes one token from the user's bucket, refilling it according to the elapsed time.
+ *
+ * @param userId - The ID of the user sending the message.
+ * @returns True if the message is allowed, false if the user exceeded the rate limit.
+ */
+function consumeMessageToken(userId: string): boolean {
+  const now = Date.now();
+  let bucket = userMessageBuckets.get(userId);
+  if (!bucket) {
+    bucket = { tokens: MAX_MESSAGES_PER_WINDOW, lastRefill: now };
+    userMessageBuckets.set(userId, bucket);
+  }
+  bucket.tokens = Math.min(
+    MAX_MESSAGES_PER_WINDOW,
+    bucket.tokens + (now - bucket.lastRefill) * REFILL_PER_MS
+  );
+  bucket.lastRefill = now;
+  if (bucket.tokens < 1) return false;
+  bucket.tokens -= 1;
+  return true;
+}
 
 async function websocketRoutes(fastify: FastifyInstance) {
   fastify.get(
@@ -58,43 +85,29 @@ async function websocketRoutes(fastify: FastifyInstance) {
       const onlineUserIds = Array.from(connectedClients.keys());
       socket.send(JSON.stringify({ type: 'online_users_list', users: onlineUserIds }));
 
+      const onlineFrame = JSON.stringify({ type: 'user_online', userId });
       for (const [id, clientSocket] of connectedClients.entries()) {
         if (id !== userId) {
-          clientSocket.send(JSON.stringify({ type: 'user_online', userId }));
+          clientSocket.send(onlineFrame);
         }
       }
 
       socket.on('message', (rawMessage) => {
         try {
-          const currentTime = Date.now();
-          let timestamps = userMessageTimestamps.get(userId);
-
-          if (!timestamps) {
-            timestamps = [];
-            userMessageTimestamps.set(userId, timestamps);
-          }
-
-          // Remove timestamps older than the window
-          timestamps = timestamps.filter(ts => currentTime - ts < RATE_LIMIT_WINDOW_MS);
-          userMessageTimestamps.set(userId, timestamps);
-
-          if (timestamps.length >= MAX_MESSAGES_PER_WINDOW) {
+          if (!consumeMessageToken(userId)) {
             fastify.log.warn({
               msg: `User ${userId} exceeded rate limit. Message dropped.`,
               userId,
               requestId: req.id,
-              messageCount: timestamps.length,
             });
             // Optionally send a message back to the client
             // socket.send(JSON.stringify({ type: 'error', message: 'Rate limit exceeded. Please slow down.' }));
             return; // Drop the message
           }
 
-          timestamps.push(currentTime);
-
           const message = JSON.parse(rawMessage.toString());
           if (message.type === 'ping') {
-            socket.send(JSON.stringify({ type: 'pong' }));
+            socket.send(PONG_FRAME);
           } else {
             fastify.log.warn({ userId, requestId: req.id, message }, 'Received unhandled WebSocket message type');
           }
@@ -105,14 +118,15 @@ async function websocketRoutes(fastify: FastifyInstance) {
 
       socket.on('close', (code, reason) => {
         connectedClients.delete(userId);
-        userMessageTimestamps.delete(userId); // Clean up rate limit data on disconnect
+        userMessageBuckets.delete(userId); // Clean up rate limit data on disconnect
         fastify.log.info({
           msg: `User ${userId} disconnected from WebSocket. Code: ${code}, Reason: ${reason.toString() || 'N/A'}. Total clients: ${connectedClients.size}`,
           userId,
           requestId: req.id,
         });
-        for (const [id, clientSocket] of connectedClients.entries()) {
-          clientSocket.send(JSON.stringify({ type: 'user_offline', userId }));
+        const offlineFrame = JSON.stringify({ type: 'user_offline', userId });
+        for (const clientSocket of connectedClients.values()) {
+          clientSocket.send(offlineFrame);
         }
       });
 
@@ -126,9 +140,10 @@ async function websocketRoutes(fastify: FastifyInstance) {
         });
         if (connectedClients.has(userId)) {
           connectedClients.delete(userId);
-          userMessageTimestamps.delete(userId); // Clean up rate limit data on error
-          for (const [id, clientSocket] of connectedClients.entries()) {
-            clientSocket.send(JSON.stringify({ type: 'user_offline', userId }));
+          userMessageBuckets.delete(userId); // Clean up rate limit data on error
+          const offlineFrame = JSON.stringify({ type: 'user_offline', userId });
+          for (const clientSocket of connectedClients.values()) {
+            clientSocket.send(offlineFrame);
           }
         }
       });
@@ -5,6 +5,8 @@ type OnlineStatusChangeCallback = (userId: string, isOnline: boolean) => void;
 
 const PING_INTERVAL = 30 * 1000;
 const MAX_SERVER_INACTIVITY_DURATION = 75 * 1000;
+const RECONNECT_BASE_DELAY = 1000;
+const RECONNECT_MAX_DELAY = 30 * 1000;
 const DEFAULT_WS_URL = 'wss://localhost:$HTTPS_PORT/ws/status';
 
 export class WebSocketClient {
@@ -15,6 +17,8 @@ export class WebSocketClient {
 	private statusChangeListeners: OnlineStatusChangeCallback[] = [];
 	private pingIntervalId: NodeJS.Timeout | null = null;
 	private serverInactivityTimerId: NodeJS.Timeout | null = null;
+	private reconnectAttempts = 0;
+	private reconnectTimerId: NodeJS.Timeout | null = null;
 
 	private constructor(url: string) {
 		this.url = url;
@@ -111,6 +115,9 @@ export class WebSocketClient {
 					this.notifyStatusChangeListeners(data.userId, false);
 				}
 				break;
+			case 'pong':
+				this.reconnectAttempts = 0;
+				break;
 		}
 	}
 
@@ -169,6 +176,7 @@ export class WebSocketClient {
 	public disconnect(): void {
 		this.stopKeepAlive();
 		this.clearServerInactivityTimer();
+		this.clearReconnectTimer();
 		if (this.socket) this.socket.close();
 	}
 
@@ -229,13 +237,25 @@ export class WebSocketClient {
 		}
 	}
 
+	private clearReconnectTimer(): void {
+		if (this.reconnectTimerId) {
+			clearTimeout(this.reconnectTimerId);
+			this.reconnectTimerId = null;
+		}
+	}
+
 	private handleServerInactivity(): void {
 		if (this.socket?.readyState === WebSocket.OPEN) {
 			NotificationManager.showWarning(
 				'No response from server. Connection may be stale. Attempting to reconnect.'
 			);
 			this.disconnect();
-			setTimeout(() => this.connect(), 1000);
+			const delay = Math.min(RECONNECT_MAX_DELAY, RECONNECT_BASE_DELAY * 2 ** this.reconnectAttempts);
+			this.reconnectAttempts++;
+			this.reconnectTimerId = setTimeout(() => {
+				this.reconnectTimerId = null;
+				this.connect();
+			}, delay * (0.5 + Math.random()));
 		}
 	}
 }
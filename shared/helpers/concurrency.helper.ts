@@ -0,0 +1,38 @@
+/**
+ * Maximum number of lookups issued at once to other microservices for a single request.
+ * Callers map one lookup per item so that this bounds the requests in flight.
+ */
+export const LOOKUP_CONCURRENCY = 8;
+
+/**
+ * Maps items through an async function with at most `limit` calls in flight at a time.
+ * No new calls are started once one of them has rejected.
+ *
+ * @param items - The items to map.
+ * @param limit - The maximum number of concurrent calls.
+ * @param fn - The async function applied to each item and its index.
+ * @returns The results, in the same order as the input items.
+ * @throws The first error thrown by `fn`.
+ */
+export async function mapWithConcurrency<T, R>(
+  items: T[],
+  limit: number,
+  fn: (item: T, index: number) => Promise<R>
+): Promise<R[]> {
+  const results = new Array<R>(items.length);
+  let next = 0;
+  let failed = false;
+  const worker = async () => {
+    while (!failed && next < items.length) {
+      const index = next++;
+      try {
+        results[index] = await fn(items[index], index);
+      } catch (err) {
+        failed = true;
+        throw err;
+      }
+    }
+  };
+  await Promise.all(Array.from({ length: Math.min(limit, items.length) }, worker));
+  return results;
+}